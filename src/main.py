@@ -1,12 +1,21 @@
 import argparse
+import hashlib
+import heapq
 import io
+import mmap
+import os
+import pickle
 import re
+import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import NamedTuple
 
 import matplotlib
 import matplotlib.pyplot as plt
-from bs4 import BeautifulSoup
+from lxml import etree
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
@@ -23,27 +32,127 @@ from reportlab.platypus import (
 
 matplotlib.use('Agg')  # Use non-interactive backend
 
+# All balance page timestamps are interpreted as UTC
+_UTC = timezone.utc
+
+# Parsed transactions and analytics are cached here
+_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'mister-balance-analyzer')
+
+# Raw transaction type (as shown in the balance page) to internal transaction type
+_TYPE_MAP = {
+    'Bonificación': 'bonuses',  # Bonuses/rewards received from the game
+    'Buyout sale': 'buyout_sale',  # Selling a player via their buyout clause
+    'Buyout signing': 'buyout_signing',  # Buying a player via their buyout clause
+    'Loan purchase': 'loan_purchase',  # Acquiring a player on loan
+    'Loan sale': 'loan_sale',  # Loaning out a player to another team
+    'Penalización': 'clause_increase',  # Player's clause modified (increase if negative, decrease if positive)
+    'Purchase': 'purchase',  # Regular player purchases from the market
+    'Sale': 'sale',  # Regular player sales to the market
+}
+# Translation table to strip thousands separators and whitespace from amounts (e.g. "+1,234,567")
+# The characters are the comma plus everything matched by the regex \s, including narrow and thin spaces
+_AMOUNT_STRIP_TABLE = str.maketrans(
+    '',
+    '',
+    ',\t\n\v\f\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000',
+)
+# Table style commands shared by the ranking tables (the header and body backgrounds are set per table)
+_TABLE_STYLE_COMMANDS = [
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 9),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+]
+# Opening tag of a candidate balance history list (e.g. <ul class="wrapper balance-history">), tag and attribute
+# names are case-insensitive as in HTML and the class value may be unquoted. It can still match decoys (e.g. inside a
+# script string), so every candidate is verified by the HTML parser
+_BALANCE_HISTORY_RE = re.compile(
+    rb'<(?i:ul)(?:\s[^>]*)?\s(?i:class)\s*=\s*'
+    rb'(?:"(?:[^"]*\s)?balance-history[\s"]|\'(?:[^\']*\s)?balance-history[\s\']|balance-history(?=[\s/>]))'
+)
+# Opening or closing ul tag, to find the end of the balance history list
+_UL_TAG_RE = re.compile(rb'<(/?)(?i:ul)(?=[\s/>])')
+# Compiled XPath expressions to extract the fields of a transaction item (li element)
+_XPATH_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+_XPATH_LEFT = etree.XPath(f"(.//div[{_XPATH_CLASS.format('left')}])[1]")
+_XPATH_RIGHT = etree.XPath(f"(.//div[{_XPATH_CLASS.format('right')}])[1]")
+_XPATH_TYPE_TEXT = etree.XPath(f"(.//div[{_XPATH_CLASS.format('type')}])[1]//text()", smart_strings=False)
+_XPATH_REASON_TEXT = etree.XPath(f"(.//div[{_XPATH_CLASS.format('reason')}])[1]//text()", smart_strings=False)
+_XPATH_DATE_TITLE = etree.XPath(f"string((.//div[{_XPATH_CLASS.format('date')}])[1]/@title)", smart_strings=False)
+_XPATH_AMOUNT_TEXT = etree.XPath(f"(.//div[{_XPATH_CLASS.format('amount')}])[1]//text()", smart_strings=False)
+_XPATH_BALANCE_TEXT = etree.XPath("(.//small)[1]//text()", smart_strings=False)
+# Player transaction categories, numbered in the order they are processed when sharing a timestamp
+_PURCHASE, _CLAUSE_INCREASE, _CLAUSE_DECREASE, _SALE = range(4)
+# Transaction type to player transaction category
+_PLAYER_CATEGORY = {
+    'purchase': _PURCHASE,
+    'buyout_signing': _PURCHASE,
+    'loan_purchase': _PURCHASE,
+    'clause_increase': _CLAUSE_INCREASE,
+    'clause_decrease': _CLAUSE_DECREASE,
+    'sale': _SALE,
+    'buyout_sale': _SALE,
+    'loan_sale': _SALE,
+}
+# Transaction type to trading partner category (only buyouts and loans are exchanged with league players)
+_PARTNER_CATEGORY = {
+    'buyout_signing': _PURCHASE,
+    'loan_purchase': _PURCHASE,
+    'buyout_sale': _SALE,
+    'loan_sale': _SALE,
+}
+
+
+class Transaction(NamedTuple):
+    # Parsed balance history transaction
+    type: str
+    footballer: str | None
+    league_player_associated: str | None
+    date_full: datetime | None
+    amount: int
+    balance_after: int
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description='Mister Balance Analyzer')
-    parser.add_argument('--input_html', type=str, required=True, help='Input HTML file')
-    parser.add_argument('--output_pdf', type=str, required=True, help='Output PDF file')
+    parser.add_argument('--input_html', type=str, nargs='+', required=True, help='Input HTML file(s)')
+    parser.add_argument('--output_pdf', type=str, nargs='+', required=True, help='Output PDF file(s), one per input')
     parser.add_argument('--date-range', type=str, help='Date range filter (format: YYYY-MM-DD,YYYY-MM-DD)')
-    return parser.parse_args()
-
-
-def __parse_transaction_type(type_str):
-    type_map = {
-        'Bonificación': 'bonuses',  # Bonuses/rewards received from the game
-        'Buyout sale': 'buyout_sale',  # Selling a player via their buyout clause
-        'Buyout signing': 'buyout_signing',  # Buying a player via their buyout clause
-        'Loan purchase': 'loan_purchase',  # Acquiring a player on loan
-        'Loan sale': 'loan_sale',  # Loaning out a player to another team
-        'Penalización': 'clause_increase',  # Player's clause modified (increase if negative, decrease if positive)
-        'Purchase': 'purchase',  # Regular player purchases from the market
-        'Sale': 'sale',  # Regular player sales to the market
-    }
-    return type_map.get(type_str, type_str)
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the analytics cache')
+    args = parser.parse_args()
+    if len(args.input_html) != len(args.output_pdf):
+        parser.error('--input_html and --output_pdf must have the same number of files')
+    return args
+
+
+def __has_class(element, class_name):
+    # Check if an element has the given CSS class
+    return class_name in (element.get('class') or '').split()
+
+
+def __join_text(fragments, separator=''):
+    # Join the stripped, non-empty text fragments of an element and its descendants
+    return separator.join(text for text in (fragment.strip() for fragment in fragments) if text)
+
+
+@lru_cache(maxsize=4096)
+def __parse_date(date_str):
+    # Parse format: "04/01/2026 – 14:41" as UTC (fixed width, so slice it instead of using the slow strptime)
+    # Cached since many transactions share the same timestamp (e.g. daily market operations)
+    try:
+        return datetime(
+            int(date_str[6:10]),
+            int(date_str[3:5]),
+            int(date_str[0:2]),
+            int(date_str[13:15]),
+            int(date_str[16:18]),
+            tzinfo=_UTC,
+        )
+    except ValueError:
+        return None
 
 
 def __parse_reason(reason):
@@ -51,28 +160,30 @@ def __parse_reason(reason):
     footballer = None
     league_player_associated = None
     # Pattern: "Footballer to League Player" (buyout_sale, buyout_signing, loan_purchase, loan_sale, purchase, sale)
-    if ' to ' in reason:
-        parts = reason.split(' to ')
-        if len(parts) == 2:
-            footballer = parts[0].strip()
-            league_player_associated = parts[1].strip() if parts[1].strip() != 'Mister' else None
+    head, separator, tail = reason.partition(' to ')
+    if separator:
+        # Only a single ' to ' is a valid transfer description
+        if ' to ' not in tail:
+            footballer = head.strip()
+            league_player_associated = tail.strip()
+            if league_player_associated == 'Mister':
+                league_player_associated = None
     # Pattern: "Modificación de cláusula (X%) de Footballer" (clause_increase)
     elif 'Modificación de cláusula' in reason:
         # Find the ' de ' after the closing parenthesis to handle names with 'de' in them (e.g., "Jorge de Frutos")
         closing_paren_idx = reason.find(')')
         if closing_paren_idx != -1:
             # Look for ' de ' after the closing parenthesis
-            de_idx = reason.find(' de ', closing_paren_idx)
-            if de_idx != -1:
-                footballer = reason[de_idx + 4 :].strip()
+            _, separator, name = reason[closing_paren_idx:].partition(' de ')
+            if separator:
+                footballer = name.strip()
     # Pattern: "Jornada X" (bonuses) - no footballer or league player
     return footballer, league_player_associated
 
 
-def __create_chart_transaction_types(analytics):
+def __create_chart_transaction_types(type_summary):
     # Create pie chart for transaction types
     fig, ax = plt.subplots(figsize=(6, 6))
-    type_summary = analytics['type_summary']
     # Only show types with transactions
     types = []
     counts = []
@@ -87,7 +198,7 @@ def __create_chart_transaction_types(analytics):
     plt.tight_layout()
     # Save to bytes
     img_buffer = io.BytesIO()
-    plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
+    plt.savefig(img_buffer, format='png', dpi=100, bbox_inches='tight', pil_kwargs={'compress_level': 3})
     img_buffer.seek(0)
     plt.close()
     return img_buffer
@@ -99,42 +210,44 @@ def __create_chart_balance_timeline(transactions):
         return None
     fig, ax = plt.subplots(figsize=(8, 4))
     # Sort by date
-    sorted_trans = sorted([t for t in transactions if t['date_full']], key=lambda x: x['date_full'])
+    sorted_trans = sorted([t for t in transactions if t.date_full], key=lambda x: x.date_full)
     if not sorted_trans:
         plt.close()
         return None
-    dates = [t['date_full'] for t in sorted_trans]
-    balances = [t['balance_after'] for t in sorted_trans]
+    dates = [t.date_full for t in sorted_trans]
+    balances = [t.balance_after for t in sorted_trans]
     ax.plot(dates, balances, linewidth=2, color='#2e7d32', marker='o', markersize=2)
     ax.set_title('Balance Over Time')
     ax.set_xlabel('Date')
     ax.set_ylabel('Balance')
     ax.grid(True, alpha=0.3)
-
-    # Format Y-axis in millions
-    def millions_formatter(x, pos):
-        return f'{x/1e6:.0f}M'
-
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(millions_formatter))
+    # Label Y-axis ticks in millions once (fixed labels instead of a formatter callback on every draw)
+    y_min, y_max = ax.get_ylim()
+    y_ticks = [y for y in ax.get_yticks() if y_min <= y <= y_max]
+    ax.set_yticks(y_ticks, [f'{y / 1e6:.0f}M' for y in y_ticks])
     plt.xticks(rotation=45)
     plt.tight_layout()
     # Save to bytes
     img_buffer = io.BytesIO()
-    plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
+    plt.savefig(img_buffer, format='png', dpi=100, bbox_inches='tight', pil_kwargs={'compress_level': 3})
     img_buffer.seek(0)
     plt.close()
     return img_buffer
 
 
-def __create_chart_roi_distribution(analytics):
+def __create_chart_roi_distribution(best_roi_players):
     # Create bar chart for top ROI players
-    fig, ax = plt.subplots(figsize=(8, 5))
-    best_roi = analytics['best_roi_players'][:10]
+    best_roi = best_roi_players[:10]
     if not best_roi:
-        plt.close()
         return None
-    players = [p['player'][:15] + '...' if len(p['player']) > 15 else p['player'] for p in best_roi]
-    roi_values = [p['roi_percentage'] for p in best_roi]
+    fig, ax = plt.subplots(figsize=(8, 5))
+    # Truncate long player names so the labels fit
+    players = []
+    roi_values = []
+    for p in best_roi:
+        name = p['player']
+        players.append(name[:15] + '...' if len(name) > 15 else name)
+        roi_values.append(p['roi_percentage'])
     colors_list = ['#2e7d32' if v > 0 else '#c62828' for v in roi_values]
     ax.barh(players, roi_values, color=colors_list)
     ax.set_xlabel('ROI (%)')
@@ -143,83 +256,198 @@ def __create_chart_roi_distribution(analytics):
     plt.tight_layout()
     # Save to bytes
     img_buffer = io.BytesIO()
-    plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
+    plt.savefig(img_buffer, format='png', dpi=100, bbox_inches='tight', pil_kwargs={'compress_level': 3})
     img_buffer.seek(0)
     plt.close()
     return img_buffer
 
 
+def __create_table_style(header_color, body_color):
+    # Create a ranking table style with the given header and body background colors
+    return TableStyle(
+        _TABLE_STYLE_COMMANDS
+        + [
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(body_color)),
+        ]
+    )
+
+
+def __append_table_chunks(story, data, col_widths, style, chunk_size=40):
+    # Append a long table as consecutive tables of at most chunk_size rows, each one repeating the header row
+    # (ReportLab splits a single long table across pages in roughly quadratic time)
+    header, rows = data[0], data[1:]
+    for start in range(0, max(len(rows), 1), chunk_size):
+        table = Table([header] + rows[start : start + chunk_size], colWidths=col_widths, repeatRows=1)
+        table.setStyle(style)
+        story.append(table)
+
+
+def __parse_transaction(item):
+    # Parse a transaction item (li element) of the balance history, None if it is not a transaction
+    # Names are interned so repeated players share the same string object and hash once in the analytics
+    left_divs = _XPATH_LEFT(item)
+    right_divs = _XPATH_RIGHT(item)
+    if not left_divs or not right_divs:
+        return None
+    left_div = left_divs[0]
+    right_div = right_divs[0]
+    # Extract transaction type
+    transaction_type_raw = __join_text(_XPATH_TYPE_TEXT(left_div))
+    # Extract reason/description and parse to extract footballer and league player
+    reason = __join_text(_XPATH_REASON_TEXT(left_div), separator=' ')
+    footballer, league_player_associated = __parse_reason(reason)
+    if footballer:
+        footballer = sys.intern(footballer)
+    if league_player_associated:
+        league_player_associated = sys.intern(league_player_associated)
+    # Extract date and convert to UTC datetime
+    date_full_str = _XPATH_DATE_TITLE(left_div)
+    date_full = __parse_date(date_full_str) if date_full_str else None
+    # Extract amount
+    amount_text = __join_text(_XPATH_AMOUNT_TEXT(right_div))
+    # Parse amount (remove commas and convert to number)
+    amount_clean = amount_text.translate(_AMOUNT_STRIP_TABLE)
+    try:
+        amount = int(amount_clean)
+    except ValueError:
+        amount = 0
+    # Parse transaction type (needs amount and reason to differentiate clause modifications)
+    transaction_type = _TYPE_MAP.get(transaction_type_raw)
+    if transaction_type is None:
+        # Unknown types are kept as shown, interned so every row of the same type shares one string
+        transaction_type = sys.intern(transaction_type_raw)
+    # Differentiate between clause increase (Penalización) and clause decrease (Bonificación with clause modification)
+    if transaction_type == 'clause_increase' and amount > 0:
+        transaction_type = 'clause_decrease'
+    # Bonificación with "Modificación de cláusula" is actually a clause decrease
+    if transaction_type == 'bonuses' and 'Modificación de cláusula' in reason:
+        transaction_type = 'clause_decrease'
+    # Extract balance after transaction
+    balance_text = __join_text(_XPATH_BALANCE_TEXT(right_div))
+    balance_clean = balance_text.translate(_AMOUNT_STRIP_TABLE)
+    try:
+        balance_after = int(balance_clean)
+    except ValueError:
+        balance_after = 0
+    return Transaction(
+        type=transaction_type,
+        footballer=footballer,
+        league_player_associated=league_player_associated,
+        date_full=date_full,
+        amount=amount,
+        balance_after=balance_after,
+    )
+
+
+def __read_balance_history_candidates(input_html):
+    # Yield the candidate balance history lists (ul elements) from the memory-mapped HTML file, in document order
+    if os.path.getsize(input_html) == 0:
+        return
+    with open(input_html, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for match in _BALANCE_HISTORY_RE.finditer(mm):
+            # Skip lists inside HTML comments (e.g. a commented-out template before the real list)
+            comment_idx = mm.rfind(b'<!--', 0, match.start())
+            if comment_idx != -1 and mm.find(b'-->', comment_idx, match.start()) == -1:
+                continue
+            # Find the matching closing tag, skipping nested lists
+            depth = 1
+            for tag in _UL_TAG_RE.finditer(mm, match.end()):
+                depth += -1 if tag.group(1) else 1
+                if not depth:
+                    end_idx = mm.find(b'>', tag.end())
+                    yield mm[match.start() : end_idx + 1] if end_idx != -1 else mm[match.start() :]
+                    break
+            else:
+                # Unclosed list, let the HTML parser recover it
+                yield mm[match.start() :]
+
+
+def __parse_balance_history(source):
+    # Stream the HTML and parse each transaction item of the first balance history list as soon as it is closed,
+    # freeing it afterwards. None if the HTML has no balance history list
+    transactions = []
+    append = transactions.append
+    balance_history = None
+    # The encoding must be explicit since a section is cut off from the document <meta charset>
+    for event, element in etree.iterparse(
+        source, events=('start', 'end'), tag=('ul', 'li'), html=True, encoding='utf-8'
+    ):
+        if element.tag == 'ul':
+            if balance_history is None and event == 'start' and __has_class(element, 'balance-history'):
+                balance_history = element
+            continue
+        # Only items of the balance history list are transactions
+        if event != 'end' or balance_history is None:
+            continue
+        parent = element.getparent()
+        if parent is not balance_history:
+            continue
+        # Items without child elements can't be transactions, skip them before any XPath lookup
+        if len(element):
+            transaction = __parse_transaction(element)
+            if transaction is not None:
+                append(transaction)
+        # Free the processed item and its previous siblings
+        element.clear()
+        while element.getprevious() is not None:
+            del parent[0]
+    return transactions if balance_history is not None else None
+
+
+def __get_cache_path(input_html, date_range):
+    # Cache entries are keyed by the HTML content, the date range and this module's source,
+    # so any change to the parsing or analysis code invalidates them
+    digest = hashlib.sha1()
+    for path in (input_html, __file__):
+        with open(path, 'rb') as f:
+            digest.update(hashlib.file_digest(f, 'sha1').digest())
+    digest.update((date_range or '').encode())
+    return os.path.join(_CACHE_DIR, f'{digest.hexdigest()}.pkl')
+
+
+def __load_cache(cache_path):
+    # Load the cached (transactions, analytics), None if missing or unreadable
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f'⚠️ Ignoring unreadable cache {cache_path}: {e}')
+        return None
+
+
+def __save_cache(cache_path, transactions, analytics):
+    # Write to a temporary file first so an interrupted run never leaves a truncated cache entry
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((transactions, analytics), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f'⚠️ Could not write cache {cache_path}: {e}')
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def _parse_html(input_html):
-    # Read the HTML content
-    with open(input_html, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    # Parse the HTML content
-    soup = BeautifulSoup(html_content, 'html.parser')
-    # Find the balance history section
-    balance_history = soup.find('ul', class_='balance-history')
-    if not balance_history:
+    # Parse only the balance history section, located without parsing the rest of the document
+    for section in __read_balance_history_candidates(input_html):
+        transactions = __parse_balance_history(io.BytesIO(section))
+        if transactions:
+            break
+    else:
+        # No candidate had transactions (unusual markup, or decoys such as a list inside a script string),
+        # so parse the whole document to get exactly what the HTML parser sees
+        transactions = None
+        if os.path.getsize(input_html) > 0:
+            with open(input_html, 'rb') as f:
+                transactions = __parse_balance_history(f)
+    if transactions is None:
         print('⚠️ No balance history found')
         return []
-    # Find all transaction items (li elements)
-    transactions = []
-    for item in balance_history.find_all('li'):
-        left_div = item.find('div', class_='left')
-        right_div = item.find('div', class_='right')
-        if not left_div or not right_div:
-            continue
-        # Extract transaction type
-        type_div = left_div.find('div', class_='type')
-        transaction_type_raw = type_div.get_text(strip=True) if type_div else ''
-        # Extract reason/description and parse to extract footballer and league player
-        reason_div = left_div.find('div', class_='reason')
-        reason = reason_div.get_text(strip=True, separator=' ') if reason_div else ''
-        footballer, league_player_associated = __parse_reason(reason)
-        # Extract date and convert to UTC datetime
-        date_div = left_div.find('div', class_='date')
-        date_full_str = date_div.get('title', '') if date_div else ''
-        date_full = None
-        if date_full_str:
-            try:
-                # Parse format: "04/01/2026 – 14:41"
-                date_full = datetime.strptime(date_full_str, '%d/%m/%Y – %H:%M').replace(tzinfo=timezone.utc)
-            except ValueError:
-                pass
-        # Extract amount
-        amount_div = right_div.find('div', class_='amount')
-        amount_text = amount_div.get_text(strip=True) if amount_div else ''
-        # Parse amount (remove commas and convert to number)
-        amount_clean = re.sub(r'[,\s]', '', amount_text)
-        try:
-            amount = int(amount_clean)
-        except ValueError:
-            amount = 0
-        # Parse transaction type (needs amount and reason to differentiate clause modifications)
-        transaction_type = __parse_transaction_type(transaction_type_raw)
-        # Differentiate between clause increase (Penalización) and clause decrease (Bonificación with clause modification)
-        if transaction_type == 'clause_increase' and amount > 0:
-            transaction_type = 'clause_decrease'
-        # Bonificación with "Modificación de cláusula" is actually a clause decrease
-        if transaction_type == 'bonuses' and 'Modificación de cláusula' in reason:
-            transaction_type = 'clause_decrease'
-        # Extract balance after transaction
-        balance_small = right_div.find('small')
-        balance_text = balance_small.get_text(strip=True) if balance_small else ''
-        balance_clean = re.sub(r'[,\s]', '', balance_text)
-        try:
-            balance_after = int(balance_clean)
-        except ValueError:
-            balance_after = 0
-        # Add transaction to list
-        transactions.append(
-            {
-                'type': transaction_type,
-                'footballer': footballer,
-                'league_player_associated': league_player_associated,
-                'date_full': date_full,
-                'amount': amount,
-                'balance_after': balance_after,
-            }
-        )
     # Return the transactions
     print(f'✅ {len(transactions)} transactions parsed')
     return transactions
@@ -230,9 +458,9 @@ def _filter_transactions_by_date(transactions, date_range_str):
         return transactions
     try:
         start_str, end_str = date_range_str.split(',')
-        start_date = datetime.strptime(start_str.strip(), '%Y-%m-%d').replace(tzinfo=timezone.utc)
-        end_date = datetime.strptime(end_str.strip(), '%Y-%m-%d').replace(tzinfo=timezone.utc)
-        filtered = [t for t in transactions if t['date_full'] and start_date <= t['date_full'] <= end_date]
+        start_date = datetime.strptime(start_str.strip(), '%Y-%m-%d').replace(tzinfo=_UTC)
+        end_date = datetime.strptime(end_str.strip(), '%Y-%m-%d').replace(tzinfo=_UTC)
+        filtered = [t for t in transactions if t.date_full and start_date <= t.date_full <= end_date]
         print(f'📅 Filtered to {len(filtered)} transactions between {start_str} and {end_str}')
         return filtered
     except Exception as e:
@@ -243,97 +471,177 @@ def _filter_transactions_by_date(transactions, date_range_str):
 def _analyze(transactions):
     analytics = {}
 
-    # 1. Player profitability analysis
-    print('Analyzing player profitability...')
-    player_transactions = defaultdict(
-        lambda: {'purchases': [], 'sales': [], 'clause_increases': [], 'clause_decreases': []}
-    )
+    # Single pass over transactions: group them per player, per type and per trading partner
+    print('Analyzing transactions...')
+    # Player transactions grouped by category: (purchases, clause increases, clause decreases, sales)
+    player_transactions = {}
+    type_counts = defaultdict(int)
+    type_totals = defaultdict(int)
+    trading_partners = defaultdict(lambda: {'purchases': 0, 'sales': 0, 'spent': 0, 'earned': 0, 'net_exchange': 0})
+    buyout_signings = []
+    buyout_sales = []
+    clause_increases = []
+    clause_decreases = []
     for t in transactions:
-        if t['footballer']:
-            if t['type'] in ['purchase', 'buyout_signing', 'loan_purchase']:
-                player_transactions[t['footballer']]['purchases'].append(t)
-            elif t['type'] in ['sale', 'buyout_sale', 'loan_sale']:
-                player_transactions[t['footballer']]['sales'].append(t)
-            elif t['type'] == 'clause_increase':
-                player_transactions[t['footballer']]['clause_increases'].append(t)
-            elif t['type'] == 'clause_decrease':
-                player_transactions[t['footballer']]['clause_decreases'].append(t)
-    # Calculate profitability per "stint" (each time a player is in the team)
-    # A stint starts with a purchase and ends with a sale
+        trans_type = t.type
+        amount = t.amount
+        footballer = t.footballer
+        partner = t.league_player_associated
+        # Type summary
+        type_counts[trans_type] += 1
+        type_totals[trans_type] += amount
+        # Player transactions
+        if footballer:
+            category = _PLAYER_CATEGORY.get(trans_type)
+            if category is not None:
+                grouped = player_transactions.get(footballer)
+                if grouped is None:
+                    grouped = player_transactions[footballer] = ([], [], [], [])
+                grouped[category].append(t)
+        # Buyouts and clause modifications
+        if trans_type == 'buyout_signing':
+            buyout_signings.append(t)
+        elif trans_type == 'buyout_sale':
+            buyout_sales.append(t)
+        elif trans_type == 'clause_increase':
+            clause_increases.append(t)
+        elif trans_type == 'clause_decrease':
+            clause_decreases.append(t)
+        # Trading partners (league players)
+        if partner:
+            partner_category = _PARTNER_CATEGORY.get(trans_type)
+            if partner_category == _PURCHASE:
+                trading_partners[partner]['purchases'] += 1
+                trading_partners[partner]['spent'] += abs(amount)
+            elif partner_category == _SALE:
+                trading_partners[partner]['sales'] += 1
+                trading_partners[partner]['earned'] += amount
+
+    # Single pass over players: stints profitability, current squad and hold times
+    print('Analyzing players...')
     player_profitability = []
-    for player, data in player_transactions.items():
-        if not data['purchases']:
-            continue
-        # Sort all transactions by date, with clause_decreases before sales at same timestamp
-        all_trans = data['purchases'] + data['sales'] + data['clause_increases'] + data['clause_decreases']
-        # Custom sort: by date first, then clause_decrease before sale at same timestamp
-        type_priority = {
-            'purchase': 0,
-            'buyout_signing': 0,
-            'loan_purchase': 0,
-            'clause_increase': 1,
-            'clause_decrease': 2,  # Process clause_decrease before sale
-            'sale': 3,
-            'buyout_sale': 3,
-            'loan_sale': 3,
-        }
-        all_trans.sort(key=lambda x: (x['date_full'], type_priority.get(x['type'], 99)))
-        # Group transactions into stints
-        stints = []
-        current_stint = {'purchases': [], 'sales': [], 'clause_increases': [], 'clause_decreases': []}
-        in_stint = False
-        for t in all_trans:
-            if t['type'] in ['purchase', 'buyout_signing', 'loan_purchase']:
-                if not in_stint:
-                    # Start new stint
-                    current_stint = {'purchases': [t], 'sales': [], 'clause_increases': [], 'clause_decreases': []}
-                    in_stint = True
-                else:
-                    # Additional purchase in same stint (shouldn't happen often)
-                    current_stint['purchases'].append(t)
-            elif t['type'] in ['sale', 'buyout_sale', 'loan_sale']:
-                if in_stint:
-                    # End current stint
-                    current_stint['sales'].append(t)
-                    stints.append(current_stint)
-                    in_stint = False
-                else:
-                    # Sale without purchase (initial squad player sold)
-                    stints.append({'purchases': [], 'sales': [t], 'clause_increases': [], 'clause_decreases': []})
-            elif t['type'] == 'clause_increase':
-                if in_stint:
-                    current_stint['clause_increases'].append(t)
-            elif t['type'] == 'clause_decrease':
-                if in_stint:
-                    current_stint['clause_decreases'].append(t)
-        # If still in stint (player currently in squad), add it
-        if in_stint:
-            stints.append(current_stint)
-        # Calculate profitability for completed stints (those with sales)
-        for stint_idx, stint in enumerate(stints):
-            if stint['sales'] and stint['purchases']:  # Only completed stints with purchases
-                total_spent = sum(abs(t['amount']) for t in stint['purchases'])
-                total_spent += sum(abs(t['amount']) for t in stint['clause_increases'])
-                total_earned = sum(t['amount'] for t in stint['sales'])
-                total_earned += sum(t['amount'] for t in stint['clause_decreases'])  # Add clause decrease income
-                net_profit = total_earned - total_spent
-                # Add stint number if player has multiple stints
-                player_name = (
-                    player
-                    if len([s for s in stints if s['sales'] and s['purchases']]) == 1
-                    else f"{player} (stint {stint_idx + 1})"
-                )
-                player_profitability.append(
-                    {
-                        'player': player_name,
-                        'total_spent': total_spent,
-                        'total_earned': total_earned,
-                        'net_profit': net_profit,
-                        'num_purchases': len(stint['purchases']),
-                        'num_sales': len(stint['sales']),
-                        'num_clause_increases': len(stint['clause_increases']),
-                    }
-                )
+    current_squad = []
+    player_hold_times = {}  # Map player name to hold days
+    for player, (
+        player_purchases,
+        player_clause_increases,
+        player_clause_decreases,
+        player_sales,
+    ) in player_transactions.items():
+        # Purchases and sales sorted by date (ignoring clause modifications)
+        purchase_sale_trans = sorted(player_purchases + player_sales, key=lambda x: x.date_full)
+        if player_purchases:
+            # Calculate profitability per "stint" (each time a player is in the team)
+            # A stint starts with a purchase and ends with a sale
+            all_trans = player_purchases + player_sales + player_clause_increases + player_clause_decreases
+            # Custom sort: by date first, then by category (clause_decrease before sale at same timestamp)
+            all_trans.sort(key=lambda x: (x.date_full, _PLAYER_CATEGORY[x.type]))
+            # Group transactions into stints, accumulating amounts and counts as we go
+            stints = []
+            current_stint = None
+            for t in all_trans:
+                category = _PLAYER_CATEGORY[t.type]
+                if category == _PURCHASE:
+                    if current_stint is None:
+                        # Start new stint
+                        current_stint = {'spent': 0, 'earned': 0, 'purchases': 0, 'sales': 0, 'clause_increases': 0}
+                    # Additional purchases in the same stint shouldn't happen often
+                    current_stint['spent'] += abs(t.amount)
+                    current_stint['purchases'] += 1
+                elif category == _SALE:
+                    if current_stint is not None:
+                        # End current stint
+                        current_stint['earned'] += t.amount
+                        current_stint['sales'] += 1
+                        stints.append(current_stint)
+                        current_stint = None
+                    else:
+                        # Sale without purchase (initial squad player sold)
+                        stints.append(
+                            {'spent': 0, 'earned': t.amount, 'purchases': 0, 'sales': 1, 'clause_increases': 0}
+                        )
+                elif current_stint is not None:
+                    if category == _CLAUSE_INCREASE:
+                        current_stint['spent'] += abs(t.amount)
+                        current_stint['clause_increases'] += 1
+                    else:
+                        # Add clause decrease income
+                        current_stint['earned'] += t.amount
+            # If still in stint (player currently in squad), add it
+            if current_stint is not None:
+                stints.append(current_stint)
+            # Calculate profitability for completed stints (those with sales)
+            num_completed_stints = sum(1 for s in stints if s['sales'] and s['purchases'])
+            for stint_idx, stint in enumerate(stints):
+                if stint['sales'] and stint['purchases']:  # Only completed stints with purchases
+                    # Add stint number if player has multiple stints
+                    player_name = player if num_completed_stints == 1 else f"{player} (stint {stint_idx + 1})"
+                    player_profitability.append(
+                        {
+                            'player': player_name,
+                            'total_spent': stint['spent'],
+                            'total_earned': stint['earned'],
+                            'net_profit': stint['earned'] - stint['spent'],
+                            'num_purchases': stint['purchases'],
+                            'num_sales': stint['sales'],
+                            'num_clause_increases': stint['clause_increases'],
+                        }
+                    )
+            # Find purchase-sale pairs (stints) to calculate hold times
+            stint_idx = 0
+            purchases_queue = []
+            for t in purchase_sale_trans:
+                if _PLAYER_CATEGORY[t.type] == _PURCHASE:
+                    purchases_queue.append(t)
+                elif purchases_queue:  # Sale
+                    # Match with most recent purchase
+                    purchase = purchases_queue[-1]
+                    if purchase.date_full and t.date_full:
+                        hold_days = (t.date_full - purchase.date_full).days
+                        # Determine player name (with stint number if multiple)
+                        player_key = player if stint_idx == 0 else f"{player} (stint {stint_idx + 1})"
+                        player_hold_times[player_key] = hold_days
+                        stint_idx += 1
+                    purchases_queue = []  # Clear queue after sale
+        # Check if player is currently in squad by looking at most recent purchase/sale (ignore clause modifications)
+        if not purchase_sale_trans:
+            # Player never purchased or sold (only clause modifications) - check if they have clause increases (initial squad)
+            if player_clause_increases:
+                is_in_squad = True
+            else:
+                continue
+        else:
+            # Player is in squad if most recent purchase/sale is NOT a sale
+            is_in_squad = _PLAYER_CATEGORY[purchase_sale_trans[-1].type] != _SALE
+        if is_in_squad and (player_purchases or player_clause_increases):
+            # Calculate investment only from transactions AFTER the last sale (if any)
+            last_sale_date = None
+            if player_sales:
+                last_sale_date = max(t.date_full for t in player_sales)
+            # Sum purchases and clause increases/decreases after last sale
+            if last_sale_date:
+                relevant_purchases = [t for t in player_purchases if t.date_full > last_sale_date]
+                relevant_clause_increases = [t for t in player_clause_increases if t.date_full > last_sale_date]
+                relevant_clause_decreases = [t for t in player_clause_decreases if t.date_full > last_sale_date]
+            else:
+                relevant_purchases = player_purchases
+                relevant_clause_increases = player_clause_increases
+                relevant_clause_decreases = player_clause_decreases
+            total_invested = sum(abs(t.amount) for t in relevant_purchases)
+            total_invested += sum(abs(t.amount) for t in relevant_clause_increases)
+            total_invested -= sum(t.amount for t in relevant_clause_decreases)  # Subtract money received back
+            current_squad.append(
+                {
+                    'player': player,
+                    'total_invested': total_invested,
+                    'num_purchases': len(relevant_purchases),
+                    'num_clause_increases': len(relevant_clause_increases),
+                    'num_clause_decreases': len(relevant_clause_decreases),
+                }
+            )
+
+    # 1. Player profitability analysis
+    print('Analyzing player profitability...')
     # Sort by profitability
     player_profitability.sort(key=lambda x: x['net_profit'], reverse=True)
     analytics['player_profitability'] = player_profitability
@@ -345,41 +653,27 @@ def _analyze(transactions):
 
     # 3. Ranking of buyouts (most expensive buyout signings and sales)
     print('Analyzing buyout signings...')
-    buyout_signings = [t for t in transactions if t['type'] == 'buyout_signing']
-    buyout_signings.sort(key=lambda x: abs(x['amount']), reverse=True)
+    buyout_signings.sort(key=lambda x: abs(x.amount), reverse=True)
     analytics['top_buyout_signings'] = buyout_signings
-    buyout_sales = [t for t in transactions if t['type'] == 'buyout_sale']
-    buyout_sales.sort(key=lambda x: x['amount'], reverse=True)
+    buyout_sales.sort(key=lambda x: x.amount, reverse=True)
     analytics['top_buyout_sales'] = buyout_sales
 
     # 4. Transaction type breakdown
     print('Analyzing transaction type breakdown...')
-    type_summary = defaultdict(lambda: {'count': 0, 'total_amount': 0, 'avg_amount': 0})
-    for t in transactions:
-        type_summary[t['type']]['count'] += 1
-        type_summary[t['type']]['total_amount'] += t['amount']
-    for trans_type in type_summary:
-        count = type_summary[trans_type]['count']
-        type_summary[trans_type]['avg_amount'] = type_summary[trans_type]['total_amount'] / count if count > 0 else 0
-    analytics['type_summary'] = dict(type_summary)
+    analytics['type_summary'] = {
+        trans_type: {
+            'count': count,
+            'total_amount': type_totals[trans_type],
+            'avg_amount': type_totals[trans_type] / count,
+        }
+        for trans_type, count in type_counts.items()
+    }
 
     # 5. Most active trading partners (league players)
     print('Analyzing most active trading partners...')
-    trading_partners = defaultdict(lambda: {'purchases': 0, 'sales': 0, 'spent': 0, 'earned': 0, 'net_exchange': 0})
-    for t in transactions:
-        if t['league_player_associated']:
-            partner = t['league_player_associated']
-            if t['type'] in ['buyout_signing', 'loan_purchase']:
-                trading_partners[partner]['purchases'] += 1
-                trading_partners[partner]['spent'] += abs(t['amount'])
-            elif t['type'] in ['buyout_sale', 'loan_sale']:
-                trading_partners[partner]['sales'] += 1
-                trading_partners[partner]['earned'] += t['amount']
     # Calculate net exchange for each partner
-    for partner in trading_partners:
-        trading_partners[partner]['net_exchange'] = (
-            trading_partners[partner]['earned'] - trading_partners[partner]['spent']
-        )
+    for partner_summary in trading_partners.values():
+        partner_summary['net_exchange'] = partner_summary['earned'] - partner_summary['spent']
     top_partners = sorted(
         [{'partner': k, **v} for k, v in trading_partners.items()], key=lambda x: x['net_exchange'], reverse=True
     )
@@ -399,10 +693,8 @@ def _analyze(transactions):
 
     # 8. Clause modification analysis (increases and decreases)
     print('Analyzing clause modification analysis...')
-    clause_increases = [t for t in transactions if t['type'] == 'clause_increase']
-    clause_decreases = [t for t in transactions if t['type'] == 'clause_decrease']
-    total_clause_increase_cost = sum(abs(t['amount']) for t in clause_increases)
-    total_clause_decrease_income = sum(t['amount'] for t in clause_decreases)
+    total_clause_increase_cost = sum(abs(t.amount) for t in clause_increases)
+    total_clause_decrease_income = sum(t.amount for t in clause_decreases)
     analytics['clause_increase_summary'] = {
         'total_count': len(clause_increases),
         'total_cost': total_clause_increase_cost,
@@ -417,79 +709,12 @@ def _analyze(transactions):
 
     # 9. Current squad value (players purchased but not sold, or initial squad with clause increases)
     print('Analyzing current squad value...')
-    current_squad = []
-    for player, data in player_transactions.items():
-        # Check if player is currently in squad by looking at most recent purchase/sale (ignore clause modifications)
-        purchase_sale_trans = data['purchases'] + data['sales']
-        if not purchase_sale_trans:
-            # Player never purchased or sold (only clause modifications) - check if they have clause increases (initial squad)
-            if data['clause_increases']:
-                is_in_squad = True
-            else:
-                continue
-        else:
-            # Sort by date to find most recent purchase or sale
-            purchase_sale_trans.sort(key=lambda x: x['date_full'])
-            most_recent = purchase_sale_trans[-1]
-            # Player is in squad if most recent purchase/sale is NOT a sale
-            is_in_squad = most_recent['type'] not in ['sale', 'buyout_sale', 'loan_sale']
-        if is_in_squad and (data['purchases'] or data['clause_increases']):
-            # Calculate investment only from transactions AFTER the last sale (if any)
-            last_sale_date = None
-            if data['sales']:
-                last_sale_date = max(t['date_full'] for t in data['sales'])
-            # Sum purchases and clause increases/decreases after last sale
-            if last_sale_date:
-                relevant_purchases = [t for t in data['purchases'] if t['date_full'] > last_sale_date]
-                relevant_clause_increases = [t for t in data['clause_increases'] if t['date_full'] > last_sale_date]
-                relevant_clause_decreases = [t for t in data['clause_decreases'] if t['date_full'] > last_sale_date]
-            else:
-                relevant_purchases = data['purchases']
-                relevant_clause_increases = data['clause_increases']
-                relevant_clause_decreases = data['clause_decreases']
-            total_invested = sum(abs(t['amount']) for t in relevant_purchases)
-            total_invested += sum(abs(t['amount']) for t in relevant_clause_increases)
-            total_invested -= sum(t['amount'] for t in relevant_clause_decreases)  # Subtract money received back
-            current_squad.append(
-                {
-                    'player': player,
-                    'total_invested': total_invested,
-                    'num_purchases': len(relevant_purchases),
-                    'num_clause_increases': len(relevant_clause_increases),
-                    'num_clause_decreases': len(relevant_clause_decreases),
-                }
-            )
     current_squad.sort(key=lambda x: x['total_invested'], reverse=True)
     analytics['current_squad'] = current_squad
     analytics['current_squad_total_investment'] = sum(p['total_invested'] for p in current_squad)
 
     # 10. Average Hold Time & ROI (calculated per stint from player_profitability)
     print('Analyzing hold time and ROI...')
-    # Calculate hold times per stint and match with profitability data
-    player_hold_times = {}  # Map player name to hold days
-    for player, data in player_transactions.items():
-        if not data['purchases']:
-            continue
-        # Sort all transactions by date
-        all_trans = data['purchases'] + data['sales']
-        all_trans.sort(key=lambda x: x['date_full'])
-        # Find purchase-sale pairs (stints)
-        stint_idx = 0
-        purchases_queue = []
-        for t in all_trans:
-            if t['type'] in ['purchase', 'buyout_signing', 'loan_purchase']:
-                purchases_queue.append(t)
-            elif t['type'] in ['sale', 'buyout_sale', 'loan_sale'] and purchases_queue:
-                # Match with most recent purchase
-                purchase = purchases_queue[-1]
-                if purchase['date_full'] and t['date_full']:
-                    hold_days = (t['date_full'] - purchase['date_full']).days
-                    # Determine player name (with stint number if multiple)
-                    num_completed_stints = len([s for s in [data['purchases'], data['sales']] if s])
-                    player_key = player if stint_idx == 0 else f"{player} (stint {stint_idx + 1})"
-                    player_hold_times[player_key] = hold_days
-                    stint_idx += 1
-                purchases_queue = []  # Clear queue after sale
     # Build ROI data with hold times
     roi_data = []
     hold_times = []
@@ -511,9 +736,16 @@ def _analyze(transactions):
                 }
             )
     analytics['average_hold_time'] = sum(hold_times) / len(hold_times) if hold_times else 0
-    analytics['roi_data'] = sorted(roi_data, key=lambda x: x['roi_percentage'], reverse=True)
-    analytics['best_roi_players'] = [p for p in analytics['roi_data'] if p['roi_percentage'] > 0][:20]
-    analytics['worst_roi_players'] = [p for p in analytics['roi_data'] if p['roi_percentage'] < 0][-20:]
+    # Only the best and worst 20 ROI players are reported, so select them instead of sorting every stint
+    # (roi_data is kept in player profitability order)
+    analytics['roi_data'] = roi_data
+    analytics['best_roi_players'] = heapq.nlargest(
+        20, (p for p in roi_data if p['roi_percentage'] > 0), key=lambda x: x['roi_percentage']
+    )
+    # Worst ones ordered from highest to lowest ROI (selecting in reverse keeps ties in their original order)
+    analytics['worst_roi_players'] = heapq.nsmallest(
+        20, (p for p in reversed(roi_data) if p['roi_percentage'] < 0), key=lambda x: x['roi_percentage']
+    )[::-1]
 
     # 11. Win Rate
     print('Analyzing win rate...')
@@ -597,18 +829,19 @@ def _save_pdf(analytics, output_pdf, transactions):
     story.append(Spacer(1, 0.3 * inch))
     # Add Charts
     story.append(Paragraph('Performance Charts', heading_style))
-    # Balance Timeline Chart
+    # Render the charts in-process (a worker pool costs more to start than the ~0.3 s of rendering it saves)
     balance_chart = __create_chart_balance_timeline(transactions)
+    type_chart = __create_chart_transaction_types(analytics['type_summary'])
+    roi_chart = __create_chart_roi_distribution(analytics['best_roi_players'])
+    # Balance Timeline Chart
     if balance_chart:
         story.append(Image(balance_chart, width=6 * inch, height=3 * inch))
         story.append(Spacer(1, 0.2 * inch))
     # Transaction Type Pie Chart
-    type_chart = __create_chart_transaction_types(analytics)
     if type_chart:
         story.append(Image(type_chart, width=5 * inch, height=5 * inch))
         story.append(Spacer(1, 0.2 * inch))
     # ROI Distribution Chart
-    roi_chart = __create_chart_roi_distribution(analytics)
     if roi_chart:
         story.append(Image(roi_chart, width=6 * inch, height=4 * inch))
     story.append(PageBreak())
@@ -634,10 +867,10 @@ def _save_pdf(analytics, output_pdf, transactions):
     # Transaction Type Breakdown
     story.append(Paragraph('Transaction Type Breakdown', heading_style))
     type_data = [['Type', 'Count', 'Total', 'Average']]
-    for trans_type, summary in sorted(analytics['type_summary'].items()):
-        type_data.append(
-            [trans_type, str(summary['count']), f'{summary["total_amount"]:,}', f'{summary["avg_amount"]:,.0f}']
-        )
+    type_data.extend(
+        [trans_type, str(summary['count']), f'{summary["total_amount"]:,}', f'{summary["avg_amount"]:,.0f}']
+        for trans_type, summary in sorted(analytics['type_summary'].items())
+    )
     type_table = Table(type_data, colWidths=[2 * inch, 1 * inch, 1.5 * inch, 1.5 * inch])
     type_table.setStyle(
         TableStyle(
@@ -658,139 +891,66 @@ def _save_pdf(analytics, output_pdf, transactions):
     # Best Deals
     story.append(Paragraph('Best Deals (Highest Profit)', heading_style))
     best_data = [['#', 'Player', 'Spent', 'Earned', 'Net Profit']]
-    for i, player in enumerate(analytics['best_deals'], 1):
-        best_data.append(
-            [
-                str(i),
-                player['player'],
-                f'{player["total_spent"]:,}',
-                f'{player["total_earned"]:,}',
-                f'+{player["net_profit"]:,}',
-            ]
-        )
-    best_table = Table(best_data, colWidths=[0.3 * inch, 2 * inch, 1.2 * inch, 1.2 * inch, 1.3 * inch])
-    best_table.setStyle(
-        TableStyle(
-            [
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e7d32')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f1f8e9')),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ]
-        )
+    best_data.extend(
+        [str(i), p['player'], f'{p["total_spent"]:,}', f'{p["total_earned"]:,}', f'+{p["net_profit"]:,}']
+        for i, p in enumerate(analytics['best_deals'], 1)
+    )
+    __append_table_chunks(
+        story,
+        best_data,
+        [0.3 * inch, 2 * inch, 1.2 * inch, 1.2 * inch, 1.3 * inch],
+        __create_table_style('#2e7d32', '#f1f8e9'),
     )
-    story.append(best_table)
     story.append(PageBreak())
     # Biggest Losses
     story.append(Paragraph('Biggest Losses', heading_style))
     loss_data = [['#', 'Player', 'Spent', 'Earned', 'Net Loss']]
-    for i, player in enumerate(analytics['biggest_losses'], 1):
-        loss_data.append(
-            [
-                str(i),
-                player['player'],
-                f'{player["total_spent"]:,}',
-                f'{player["total_earned"]:,}',
-                f'{player["net_profit"]:,}',
-            ]
-        )
-    loss_table = Table(loss_data, colWidths=[0.3 * inch, 2 * inch, 1.2 * inch, 1.2 * inch, 1.3 * inch])
-    loss_table.setStyle(
-        TableStyle(
-            [
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#c62828')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ffebee')),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ]
-        )
+    loss_data.extend(
+        [str(i), p['player'], f'{p["total_spent"]:,}', f'{p["total_earned"]:,}', f'{p["net_profit"]:,}']
+        for i, p in enumerate(analytics['biggest_losses'], 1)
+    )
+    __append_table_chunks(
+        story,
+        loss_data,
+        [0.3 * inch, 2 * inch, 1.2 * inch, 1.2 * inch, 1.3 * inch],
+        __create_table_style('#c62828', '#ffebee'),
     )
-    story.append(loss_table)
     story.append(Spacer(1, 0.3 * inch))
     # Top Buyout Signings
     story.append(Paragraph('Most Expensive Buyout Signings', heading_style))
     signing_data = [['#', 'Player', 'Amount', 'From']]
-    for i, t in enumerate(analytics['top_buyout_signings'], 1):
-        signing_data.append(
-            [str(i), t['footballer'], f'{t["amount"]:,}', t.get('league_player_associated', '-') or '-']
-        )
-    signing_table = Table(signing_data, colWidths=[0.3 * inch, 2 * inch, 1.5 * inch, 2.2 * inch])
-    signing_table.setStyle(
-        TableStyle(
-            [
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#d84315')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#fbe9e7')),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ]
-        )
+    signing_data.extend(
+        [str(i), t.footballer, f'{t.amount:,}', t.league_player_associated or '-']
+        for i, t in enumerate(analytics['top_buyout_signings'], 1)
+    )
+    __append_table_chunks(
+        story, signing_data, [0.3 * inch, 2 * inch, 1.5 * inch, 2.2 * inch], __create_table_style('#d84315', '#fbe9e7')
     )
-    story.append(signing_table)
     story.append(PageBreak())
     # Top Buyout Sales
     story.append(Paragraph('Highest Buyout Sales', heading_style))
     sale_data = [['#', 'Player', 'Amount', 'To']]
-    for i, t in enumerate(analytics['top_buyout_sales'], 1):
-        sale_data.append([str(i), t['footballer'], f'+{t["amount"]:,}', t.get('league_player_associated', '-') or '-'])
-    sale_table = Table(sale_data, colWidths=[0.3 * inch, 2 * inch, 1.5 * inch, 2.2 * inch])
-    sale_table.setStyle(
-        TableStyle(
-            [
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#388e3c')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#e8f5e9')),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ]
-        )
+    sale_data.extend(
+        [str(i), t.footballer, f'+{t.amount:,}', t.league_player_associated or '-']
+        for i, t in enumerate(analytics['top_buyout_sales'], 1)
+    )
+    __append_table_chunks(
+        story, sale_data, [0.3 * inch, 2 * inch, 1.5 * inch, 2.2 * inch], __create_table_style('#388e3c', '#e8f5e9')
     )
-    story.append(sale_table)
     story.append(Spacer(1, 0.3 * inch))
     # Trading Partners
     story.append(Paragraph('Trading Partners (by Net Exchange)', heading_style))
     partner_data = [['#', 'Partner', 'Purchases', 'Sales', 'Net Exchange']]
-    for i, partner in enumerate(analytics['top_trading_partners'], 1):
-        net_sign = '+' if partner['net_exchange'] >= 0 else ''
-        partner_data.append(
-            [
-                str(i),
-                partner['partner'],
-                str(partner['purchases']),
-                str(partner['sales']),
-                f'{net_sign}{partner["net_exchange"]:,}',
-            ]
-        )
-    partner_table = Table(partner_data, colWidths=[0.3 * inch, 2.2 * inch, 1 * inch, 1 * inch, 1.5 * inch])
-    partner_table.setStyle(
-        TableStyle(
-            [
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1565c0')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#e3f2fd')),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ]
-        )
+    partner_data.extend(
+        [str(i), p['partner'], str(p['purchases']), str(p['sales']), f'{p["net_exchange"]:+,}']
+        for i, p in enumerate(analytics['top_trading_partners'], 1)
+    )
+    __append_table_chunks(
+        story,
+        partner_data,
+        [0.3 * inch, 2.2 * inch, 1 * inch, 1 * inch, 1.5 * inch],
+        __create_table_style('#1565c0', '#e3f2fd'),
     )
-    story.append(partner_table)
     story.append(PageBreak())
     # Clause Increase Summary
     story.append(Paragraph('Clause Increase Summary', heading_style))
@@ -820,8 +980,9 @@ def _save_pdf(analytics, output_pdf, transactions):
     story.append(Paragraph(f'Current Squad Investment: {analytics["current_squad_total_investment"]:,}', heading_style))
     story.append(Paragraph(f'Players in squad: {len(analytics["current_squad"])}', subheading_style))
     squad_data = [['#', 'Player', 'Total Invested']]
-    for i, player in enumerate(analytics['current_squad'], 1):
-        squad_data.append([str(i), player['player'], f'{player["total_invested"]:,}'])
+    squad_data.extend(
+        [str(i), p['player'], f'{p["total_invested"]:,}'] for i, p in enumerate(analytics['current_squad'], 1)
+    )
     squad_table = Table(squad_data, colWidths=[0.5 * inch, 3.5 * inch, 2 * inch])
     squad_table.setStyle(
         TableStyle(
@@ -845,76 +1006,68 @@ def _save_pdf(analytics, output_pdf, transactions):
     # Best ROI Players
     story.append(Paragraph('Best ROI Players', subheading_style))
     roi_best_data = [['#', 'Player', 'ROI %', 'Profit', 'Hold Days']]
-    for i, player in enumerate(analytics['best_roi_players'][:20], 1):
-        roi_best_data.append(
-            [
-                str(i),
-                player['player'],
-                f'{player["roi_percentage"]:.1f}%',
-                f'+{player["net_profit"]:,}',
-                str(player['hold_days']),
-            ]
-        )
-    roi_best_table = Table(roi_best_data, colWidths=[0.3 * inch, 2.5 * inch, 1 * inch, 1.5 * inch, 0.7 * inch])
-    roi_best_table.setStyle(
-        TableStyle(
-            [
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e7d32')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f1f8e9')),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ]
-        )
+    roi_best_data.extend(
+        [str(i), p['player'], f'{p["roi_percentage"]:.1f}%', f'+{p["net_profit"]:,}', str(p['hold_days'])]
+        for i, p in enumerate(analytics['best_roi_players'][:20], 1)
     )
+    roi_best_table = Table(roi_best_data, colWidths=[0.3 * inch, 2.5 * inch, 1 * inch, 1.5 * inch, 0.7 * inch])
+    roi_best_table.setStyle(__create_table_style('#2e7d32', '#f1f8e9'))
     story.append(roi_best_table)
     story.append(Spacer(1, 0.3 * inch))
     # Worst ROI Players
     story.append(Paragraph('Worst ROI Players', subheading_style))
     roi_worst_data = [['#', 'Player', 'ROI %', 'Loss', 'Hold Days']]
-    for i, player in enumerate(analytics['worst_roi_players'][:20], 1):
-        roi_worst_data.append(
-            [
-                str(i),
-                player['player'],
-                f'{player["roi_percentage"]:.1f}%',
-                f'{player["net_profit"]:,}',
-                str(player['hold_days']),
-            ]
-        )
-    roi_worst_table = Table(roi_worst_data, colWidths=[0.3 * inch, 2.5 * inch, 1 * inch, 1.5 * inch, 0.7 * inch])
-    roi_worst_table.setStyle(
-        TableStyle(
-            [
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#c62828')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ffebee')),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ]
-        )
+    roi_worst_data.extend(
+        [str(i), p['player'], f'{p["roi_percentage"]:.1f}%', f'{p["net_profit"]:,}', str(p['hold_days'])]
+        for i, p in enumerate(analytics['worst_roi_players'][:20], 1)
     )
+    roi_worst_table = Table(roi_worst_data, colWidths=[0.3 * inch, 2.5 * inch, 1 * inch, 1.5 * inch, 0.7 * inch])
+    roi_worst_table.setStyle(__create_table_style('#c62828', '#ffebee'))
     story.append(roi_worst_table)
     # Build PDF
     doc.build(story)
     print(f'✅ PDF saved to: {output_pdf}')
 
 
-def main(input_html, output_pdf, date_range=None):
-    transactions = _parse_html(input_html)
-    if transactions:
+def _generate_report(input_html, output_pdf, date_range=None, use_cache=True):
+    cache_path = __get_cache_path(input_html, date_range) if use_cache else None
+    cached = __load_cache(cache_path) if cache_path else None
+    if cached is not None:
+        print('♻️ Using cached analytics')
+        transactions, analytics = cached
+    else:
+        transactions = _parse_html(input_html)
+        if not transactions:
+            return
         if date_range:
             transactions = _filter_transactions_by_date(transactions, date_range)
         analytics = _analyze(transactions)
-        _save_pdf(analytics, output_pdf, transactions)
+        if cache_path:
+            __save_cache(cache_path, transactions, analytics)
+    _save_pdf(analytics, output_pdf, transactions)
+
+
+def main(input_html, output_pdf, date_range=None, use_cache=True):
+    # Accept a single path (as before) or a list of paths with one output per input
+    input_htmls = [input_html] if isinstance(input_html, str) else list(input_html)
+    output_pdfs = [output_pdf] if isinstance(output_pdf, str) else list(output_pdf)
+    if len(input_htmls) != len(output_pdfs):
+        raise ValueError('input_html and output_pdf must have the same number of files')
+    workers = min(len(input_htmls), os.cpu_count() or 1)
+    if workers <= 1:
+        for input_file, output_file in zip(input_htmls, output_pdfs):
+            _generate_report(input_file, output_file, date_range, use_cache)
+        return
+    # Each report is independent, so generate them in parallel (one process per file, charts render in-process)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_generate_report, input_file, output_file, date_range, use_cache)
+            for input_file, output_file in zip(input_htmls, output_pdfs)
+        ]
+        for future in futures:
+            future.result()
 
 
 if __name__ == '__main__':
     args = parse_args()
-    main(args.input_html, args.output_pdf, args.date_range)
+    main(args.input_html, args.output_pdf, args.date_range, use_cache=not args.no_cache)